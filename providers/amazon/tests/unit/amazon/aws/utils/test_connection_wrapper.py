@@ -16,6 +16,8 @@
 # under the License.
 from __future__ import annotations
 
+import functools
+import json
 import os
 import warnings
 from dataclasses import fields
@@ -35,14 +37,77 @@ pytestmark = pytest.mark.db_test
 MOCK_AWS_CONN_ID = "mock-conn-id"
 MOCK_CONN_TYPE = "aws"
 MOCK_ROLE_ARN = "arn:aws:iam::222222222222:role/awesome-role"
+SKIP_DB_TESTS = os.environ.get("_AIRFLOW_SKIP_DB_TESTS") == "true"
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_connection(conn_id: str | None, conn_type: str | None, **kwargs) -> Connection:
+    return Connection(conn_id=conn_id, conn_type=conn_type, **kwargs)
 
 
 def mock_connection_factory(
     conn_id: str | None = MOCK_AWS_CONN_ID, conn_type: str | None = MOCK_CONN_TYPE, **kwargs
 ) -> Connection | None:
-    if os.environ.get("_AIRFLOW_SKIP_DB_TESTS") == "true":
+    """Return a ``Connection`` shared by all calls with the same arguments, callers must not mutate it."""
+    if SKIP_DB_TESTS:
         return None
-    return Connection(conn_id=conn_id, conn_type=conn_type, **kwargs)
+    extra = kwargs.get("extra")
+    if extra is not None and not isinstance(extra, str):
+        # A JSON string makes any dict extra, even an empty one, usable as a cache key,
+        # sorted keys make equal dicts share one entry
+        kwargs["extra"] = json.dumps(extra, sort_keys=True)
+    # Sharing is fine because tests only read the connection. Side effects of `Connection.__init__`
+    # (e.g. masking the password) run on the first construction only, which these tests do not check.
+    return _cached_connection(conn_id, conn_type, **kwargs)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_wrapper(conn: Connection | None) -> AwsConnectionWrapper:
+    return AwsConnectionWrapper(conn=conn)
+
+
+def mock_wrapper_factory(**kwargs) -> AwsConnectionWrapper:
+    """Return a wrapper over ``mock_connection_factory(**kwargs)`` shared by tests which only read it."""
+    # Connections are cached by their arguments, so the connection object itself is a stable cache key
+    return _cached_wrapper(mock_connection_factory(**kwargs))
+
+
+@functools.cache
+def _non_init_fields(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls) if not f.init)
+
+
+SESSION_KWARGS = {
+    "aws_access_key_id": "mock-aws-access-key-id",
+    "aws_secret_access_key": "mock-aws-secret-access-key",
+    "aws_session_token": "mock-aws-session-token",
+    "profile_name": "mock-profile",
+    "region_name": "mock-region-name",
+}
+SESSION_KWARGS_CASES = [
+    pytest.param(dict.fromkeys(SESSION_KWARGS), {}, id="not-set"),
+    pytest.param(SESSION_KWARGS, SESSION_KWARGS, id="all-set"),
+    pytest.param(
+        {**dict.fromkeys(SESSION_KWARGS), "aws_session_token": "mock-aws-session-token"},
+        {"aws_session_token": "mock-aws-session-token"},
+        id="session-token-only",
+    ),
+    pytest.param(
+        {**SESSION_KWARGS, "aws_session_token": None},
+        {k: v for k, v in SESSION_KWARGS.items() if k != "aws_session_token"},
+        id="without-session-token",
+    ),
+    pytest.param(
+        {**dict.fromkeys(SESSION_KWARGS), "profile_name": "mock-profile", "region_name": "mock-region-name"},
+        {"profile_name": "mock-profile", "region_name": "mock-region-name"},
+        id="profile-and-region",
+    ),
+    pytest.param(
+        {**SESSION_KWARGS, "profile_name": None, "region_name": None},
+        {k: v for k, v in SESSION_KWARGS.items() if k not in ("profile_name", "region_name")},
+        id="credentials-only",
+    ),
+]
 
 
 class TestsConnectionMetadata:
@@ -75,7 +140,9 @@ class TestsConnectionMetadata:
 
 
 class TestAwsConnectionWrapper:
-    @pytest.mark.parametrize("extra", [{"foo": "bar", "spam": "egg"}, '{"foo": "bar", "spam": "egg"}', None])
+    @pytest.mark.parametrize(
+        "extra", [{"foo": "bar", "spam": "egg"}, '{"foo": "bar", "spam": "egg"}', {}, None]
+    )
     def test_values_from_connection(self, extra):
         mock_conn = mock_connection_factory(
             login="mock-login",
@@ -154,33 +221,9 @@ class TestAwsConnectionWrapper:
         assert wrap_conn.aws_secret_access_key == aws_secret_access_key
         assert wrap_conn.aws_session_token == aws_session_token
 
-    @pytest.mark.parametrize("aws_access_key_id", [None, "mock-aws-access-key-id"])
-    @pytest.mark.parametrize("aws_secret_access_key", [None, "mock-aws-secret-access-key"])
-    @pytest.mark.parametrize("aws_session_token", [None, "mock-aws-session-token"])
-    @pytest.mark.parametrize("profile_name", [None, "mock-profile"])
-    @pytest.mark.parametrize("region_name", [None, "mock-region-name"])
-    def test_get_session_kwargs_from_wrapper(
-        self, aws_access_key_id, aws_secret_access_key, aws_session_token, profile_name, region_name
-    ):
-        mock_conn_extra = {
-            "aws_access_key_id": aws_access_key_id,
-            "aws_secret_access_key": aws_secret_access_key,
-            "aws_session_token": aws_session_token,
-            "profile_name": profile_name,
-            "region_name": region_name,
-        }
+    @pytest.mark.parametrize("mock_conn_extra, expected", SESSION_KWARGS_CASES)
+    def test_get_session_kwargs_from_wrapper(self, mock_conn_extra, expected):
         mock_conn = mock_connection_factory(extra=mock_conn_extra)
-        expected = {}
-        if aws_access_key_id:
-            expected["aws_access_key_id"] = aws_access_key_id
-        if aws_secret_access_key:
-            expected["aws_secret_access_key"] = aws_secret_access_key
-        if aws_session_token:
-            expected["aws_session_token"] = aws_session_token
-        if profile_name:
-            expected["profile_name"] = profile_name
-        if region_name:
-            expected["region_name"] = region_name
         with warnings.catch_warnings():
             warnings.simplefilter("error")  # Not expected any warnings here
             wrap_conn = AwsConnectionWrapper(conn=mock_conn)
@@ -249,18 +292,17 @@ class TestAwsConnectionWrapper:
 
     @pytest.mark.parametrize("aws_account_id, aws_iam_role", [(None, None), ("111111111111", "another-role")])
     def test_get_role_arn(self, aws_account_id, aws_iam_role):
-        mock_conn = mock_connection_factory(
+        wrap_conn = mock_wrapper_factory(
             extra={
                 "role_arn": MOCK_ROLE_ARN,
                 "aws_account_id": aws_account_id,
                 "aws_iam_role": aws_iam_role,
             }
         )
-        wrap_conn = AwsConnectionWrapper(conn=mock_conn)
         assert wrap_conn.role_arn == MOCK_ROLE_ARN
 
     def test_empty_role_arn(self):
-        wrap_conn = AwsConnectionWrapper(conn=mock_connection_factory())
+        wrap_conn = mock_wrapper_factory()
         assert wrap_conn.role_arn is None
         assert wrap_conn.assume_role_method is None
         assert wrap_conn.assume_role_kwargs == {}
@@ -269,19 +311,17 @@ class TestAwsConnectionWrapper:
         "assume_role_method", ["assume_role", "assume_role_with_saml", "assume_role_with_web_identity"]
     )
     def test_get_assume_role_method(self, assume_role_method):
-        mock_conn = mock_connection_factory(
+        wrap_conn = mock_wrapper_factory(
             extra={"role_arn": MOCK_ROLE_ARN, "assume_role_method": assume_role_method}
         )
-        wrap_conn = AwsConnectionWrapper(conn=mock_conn)
         assert wrap_conn.assume_role_method == assume_role_method
 
     def test_default_assume_role_method(self):
-        mock_conn = mock_connection_factory(
+        wrap_conn = mock_wrapper_factory(
             extra={
                 "role_arn": MOCK_ROLE_ARN,
             }
         )
-        wrap_conn = AwsConnectionWrapper(conn=mock_conn)
         assert wrap_conn.assume_role_method == "assume_role"
 
     def test_unsupported_assume_role_method(self):
@@ -296,9 +336,7 @@ class TestAwsConnectionWrapper:
         mock_conn_extra = {"role_arn": MOCK_ROLE_ARN}
         if assume_role_kwargs:
             mock_conn_extra["assume_role_kwargs"] = assume_role_kwargs
-        mock_conn = mock_connection_factory(extra=mock_conn_extra)
-
-        wrap_conn = AwsConnectionWrapper(conn=mock_conn)
+        wrap_conn = mock_wrapper_factory(extra=mock_conn_extra)
         expected = assume_role_kwargs or {}
         assert wrap_conn.assume_role_kwargs == expected
 
@@ -311,40 +349,46 @@ class TestAwsConnectionWrapper:
         }
         if external_id_in_extra:
             mock_conn_extra["external_id"] = external_id_in_extra
-        mock_conn = mock_connection_factory(extra=mock_conn_extra)
-
-        wrap_conn = AwsConnectionWrapper(conn=mock_conn)
+        wrap_conn = mock_wrapper_factory(extra=mock_conn_extra)
         assert "ExternalId" in wrap_conn.assume_role_kwargs
         assert wrap_conn.assume_role_kwargs["ExternalId"] == mock_external_id_in_kwargs
         assert wrap_conn.assume_role_kwargs["ExternalId"] != external_id_in_extra
 
     @pytest.mark.parametrize(
-        "orig_wrapper",
+        "orig_wrapper_factory",
         [
-            AwsConnectionWrapper(
-                conn=mock_connection_factory(
-                    login="mock-login",
-                    password="mock-password",
-                    extra={
-                        "region_name": "mock-region",
-                        "botocore_kwargs": {"user_agent": "Airflow Amazon Provider"},
-                        "role_arn": MOCK_ROLE_ARN,
-                        "aws_session_token": "mock-aws-session-token",
-                    },
+            pytest.param(
+                lambda: AwsConnectionWrapper(
+                    conn=mock_connection_factory(
+                        login="mock-login",
+                        password="mock-password",
+                        extra={
+                            "region_name": "mock-region",
+                            "botocore_kwargs": {"user_agent": "Airflow Amazon Provider"},
+                            "role_arn": MOCK_ROLE_ARN,
+                            "aws_session_token": "mock-aws-session-token",
+                        },
+                    ),
                 ),
+                id="connection-with-extra",
             ),
-            AwsConnectionWrapper(conn=mock_connection_factory()),
-            AwsConnectionWrapper(conn=None),
-            AwsConnectionWrapper(
-                conn=None,
-                region_name="mock-region",
-                botocore_config=Config(user_agent="Airflow Amazon Provider"),
+            pytest.param(lambda: AwsConnectionWrapper(conn=mock_connection_factory()), id="connection"),
+            pytest.param(lambda: AwsConnectionWrapper(conn=None), id="no-connection"),
+            pytest.param(
+                lambda: AwsConnectionWrapper(
+                    conn=None,
+                    region_name="mock-region",
+                    botocore_config=Config(user_agent="Airflow Amazon Provider"),
+                ),
+                id="no-connection-with-params",
             ),
         ],
     )
     @pytest.mark.parametrize("region_name", [None, "ca-central-1"])
     @pytest.mark.parametrize("botocore_config", [None, Config(region_name="ap-southeast-1")])
-    def test_wrap_wrapper(self, orig_wrapper, region_name, botocore_config):
+    def test_wrap_wrapper(self, orig_wrapper_factory, region_name, botocore_config):
+        # Wrappers are built lazily, so nothing is constructed for deselected tests during collection
+        orig_wrapper = orig_wrapper_factory()
         wrap_kwargs = {}
         if region_name:
             wrap_kwargs["region_name"] = region_name
@@ -353,8 +397,7 @@ class TestAwsConnectionWrapper:
         wrap_conn = AwsConnectionWrapper(conn=orig_wrapper, **wrap_kwargs)
 
         # Non init fields should be same in orig_wrapper and child wrapper
-        wrap_non_init_fields = [f.name for f in fields(wrap_conn) if not f.init]
-        for field in wrap_non_init_fields:
+        for field in _non_init_fields(type(wrap_conn)):
             assert getattr(wrap_conn, field) == getattr(orig_wrapper, field), (
                 "Expected no changes in non-init values"
             )
@@ -367,21 +410,20 @@ class TestAwsConnectionWrapper:
     @pytest.mark.parametrize("profile_name", [None, "mock-profile"])
     @pytest.mark.parametrize("role_arn", [None, MOCK_ROLE_ARN])
     def test_get_wrapper_from_metadata(self, conn_id, profile_name, role_arn):
-        mock_conn = mock_connection_factory(
+        wrap_conn = mock_wrapper_factory(
             conn_id=conn_id,
             extra={
                 "role_arn": role_arn,
                 "profile_name": profile_name,
             },
         )
-        wrap_conn = AwsConnectionWrapper(conn=mock_conn)
         assert wrap_conn
         assert wrap_conn.conn_id == conn_id
         assert wrap_conn.role_arn == role_arn
         assert wrap_conn.profile_name == profile_name
 
     def test_get_service_config(self):
-        mock_conn = mock_connection_factory(
+        wrap_conn = mock_wrapper_factory(
             conn_id="foo-bar",
             extra={
                 "service_config": {
@@ -391,14 +433,13 @@ class TestAwsConnectionWrapper:
                 },
             },
         )
-        wrap_conn = AwsConnectionWrapper(conn=mock_conn)
         assert wrap_conn.get_service_config("sns") == {"foo": "bar"}
         assert wrap_conn.get_service_config("s3") == {"spam": "egg", "baz": "qux"}
         assert wrap_conn.get_service_config("ec2") == {}
         assert wrap_conn.get_service_config("dynamodb") is None
 
     def test_get_service_endpoint_url(self):
-        fake_conn = mock_connection_factory(
+        wrap_conn = mock_wrapper_factory(
             conn_id="foo-bar",
             extra={
                 "endpoint_url": "https://spam.egg",
@@ -408,7 +449,6 @@ class TestAwsConnectionWrapper:
                 },
             },
         )
-        wrap_conn = AwsConnectionWrapper(conn=fake_conn)
         assert wrap_conn.get_service_endpoint_url("sns") == "https://foo.bar"
         assert wrap_conn.get_service_endpoint_url("sts") == "https://spam.egg"
         assert wrap_conn.get_service_endpoint_url("ec2") is None
@@ -433,8 +473,7 @@ class TestAwsConnectionWrapper:
         if sts_service_endpoint_url:
             fake_extra["service_config"] = {"sts": {"endpoint_url": sts_service_endpoint_url}}
 
-        fake_conn = mock_connection_factory(conn_id="foo-bar", extra=fake_extra)
-        wrap_conn = AwsConnectionWrapper(conn=fake_conn)
+        wrap_conn = mock_wrapper_factory(conn_id="foo-bar", extra=fake_extra)
         assert wrap_conn.get_service_endpoint_url("sts", sts_connection_assume=True) == expected_endpoint_url
         assert wrap_conn.get_service_endpoint_url("sts", sts_test_connection=True) == expected_endpoint_url
 
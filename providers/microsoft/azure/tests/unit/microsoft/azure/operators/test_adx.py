@@ -54,6 +54,7 @@ MOCK_RESULT = KustoResultTable(
         "Rows": [["hi", "2017-01-01T01:01:01.0000003Z"], ["hello", "2017-01-01T01:01:01.0000003Z"]],
     }
 )
+MOCK_RESULT_STR = str(MOCK_RESULT)
 
 
 class MockResponse:
@@ -61,22 +62,21 @@ class MockResponse:
 
 
 class TestAzureDataExplorerQueryOperator:
-    def setup_method(self):
+    def test_init(self):
         args = {"owner": "airflow", "start_date": DEFAULT_DATE, "provide_context": True}
+        dag = DAG(TEST_DAG_ID + "test_schedule_dag_once", default_args=args, schedule="@once")
+        operator = AzureDataExplorerQueryOperator(dag=dag, **MOCK_DATA)
 
-        self.dag = DAG(TEST_DAG_ID + "test_schedule_dag_once", default_args=args, schedule="@once")
-        self.operator = AzureDataExplorerQueryOperator(dag=self.dag, **MOCK_DATA)
-
-    def test_init(self):
-        assert self.operator.task_id == MOCK_DATA["task_id"]
-        assert self.operator.query == MOCK_DATA["query"]
-        assert self.operator.database == MOCK_DATA["database"]
-        assert self.operator.azure_data_explorer_conn_id == "azure_data_explorer_default"
+        assert operator.task_id == MOCK_DATA["task_id"]
+        assert operator.query == MOCK_DATA["query"]
+        assert operator.database == MOCK_DATA["database"]
+        assert operator.azure_data_explorer_conn_id == "azure_data_explorer_default"
 
     @mock.patch.object(AzureDataExplorerHook, "run_query", return_value=MockResponse())
     @mock.patch.object(AzureDataExplorerHook, "get_conn")
     def test_run_query(self, mock_conn, mock_run_query):
-        self.operator.execute(None)
+        operator = AzureDataExplorerQueryOperator(**MOCK_DATA)
+        operator.execute(None)
         mock_run_query.assert_called_once_with(
             MOCK_DATA["query"], MOCK_DATA["database"], MOCK_DATA["options"]
         )
@@ -95,7 +95,7 @@ def test_azure_data_explorer_query_operator_xcom_push_and_pull(
         task = AzureDataExplorerQueryOperator(**MOCK_DATA)
         run_task(task=task)
 
-        assert run_task.xcom.get(key="return_value", task_id=task.task_id) == str(MOCK_RESULT)
+        assert run_task.xcom.get(key="return_value", task_id=task.task_id) == MOCK_RESULT_STR
     else:
         ti = create_task_instance_of_operator(
             AzureDataExplorerQueryOperator,
@@ -104,4 +104,4 @@ def test_azure_data_explorer_query_operator_xcom_push_and_pull(
         )
         ti.run()
 
-        assert ti.xcom_pull(task_ids=MOCK_DATA["task_id"]) == str(MOCK_RESULT)
+        assert ti.xcom_pull(task_ids=MOCK_DATA["task_id"]) == MOCK_RESULT_STR
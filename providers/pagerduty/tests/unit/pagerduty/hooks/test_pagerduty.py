@@ -17,57 +17,90 @@
 # under the License.
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
+from unittest import mock
+
+import pagerduty
 import pytest
 
-from airflow.models import Connection
+from airflow.exceptions import AirflowNotFoundException
 from airflow.providers.pagerduty.hooks.pagerduty import PagerdutyHook
 
+
+@dataclass(frozen=True, slots=True)
+class FakeConnection:
+    """Lightweight stand-in for ``Connection`` with only the fields read by ``PagerdutyHook``."""
+
+    conn_id: str
+    conn_type: str
+    password: str | None = None
+    extra: str | None = None
+
+    @property
+    def extra_dejson(self) -> dict:
+        return json.loads(self.extra) if self.extra else {}
+
+
 DEFAULT_CONN_ID = "pagerduty_default"
+DEFAULT_CONN = FakeConnection(
+    conn_id=DEFAULT_CONN_ID,
+    conn_type="pagerduty",
+    password="token",
+    extra='{"routing_key": "integration_key"}',
+)
+NO_EXTRA_CONN = FakeConnection(
+    conn_id="pagerduty_no_extra", conn_type="pagerduty", password="pagerduty_token_without_extra"
+)
 
 
-@pytest.fixture(autouse=True)
-def pagerduty_connections(create_connection_without_db):
-    create_connection_without_db(
-        Connection(
-            conn_id=DEFAULT_CONN_ID,
-            conn_type="pagerduty",
-            password="token",
-            extra='{"routing_key": "integration_key"}',
-        )
-    )
-    create_connection_without_db(
-        Connection(
-            conn_id="pagerduty_no_extra", conn_type="pagerduty", password="pagerduty_token_without_extra"
-        ),
-    )
+@pytest.fixture(scope="module", autouse=True)
+def pagerduty_connections():
+    """Serve tests connections directly, without a lookup through the secrets backends."""
+    connections = {conn.conn_id: conn for conn in (DEFAULT_CONN, NO_EXTRA_CONN)}
+
+    def get_connection(conn_id: str) -> FakeConnection:
+        if conn_id not in connections:
+            raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
+        return connections[conn_id]
+
+    with mock.patch.object(PagerdutyHook, "get_connection", side_effect=get_connection):
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_hook(pagerduty_connections):
+    return PagerdutyHook(pagerduty_conn_id=DEFAULT_CONN_ID)
 
 
 class TestPagerdutyHook:
-    def test_get_token_from_password(self, pagerduty_connections):
-        hook = PagerdutyHook(pagerduty_conn_id=DEFAULT_CONN_ID)
-        assert hook.token == "token", "token initialised."
-        assert hook.routing_key == "integration_key"
-
-    def test_without_routing_key_extra(self):
-        hook = PagerdutyHook(pagerduty_conn_id="pagerduty_no_extra")
-        assert hook.token == "pagerduty_token_without_extra", "token initialised."
-        assert hook.routing_key is None, "default routing key skipped."
-
-    def test_token_parameter_override(self):
-        hook = PagerdutyHook(token="pagerduty_param_token", pagerduty_conn_id=DEFAULT_CONN_ID)
-        assert hook.token == "pagerduty_param_token", "token initialised."
-
-    def test_get_service(self, requests_mock):
-        hook = PagerdutyHook(pagerduty_conn_id=DEFAULT_CONN_ID)
-        mock_response_body = {
-            "id": "PZYX321",
-            "name": "Apache Airflow",
-            "status": "active",
-            "type": "service",
-            "summary": "Apache Airflow",
-            "self": "https://api.pagerduty.com/services/PZYX321",
-        }
-        requests_mock.get("https://api.pagerduty.com/services/PZYX321", json={"service": mock_response_body})
-        client = hook.client()
-        resp = client.rget("/services/PZYX321")
-        assert resp == mock_response_body
+    @pytest.mark.parametrize(
+        "hook_kwargs, expected_token, expected_routing_key",
+        [
+            pytest.param(
+                {"pagerduty_conn_id": DEFAULT_CONN_ID}, "token", "integration_key", id="token-from-password"
+            ),
+            pytest.param(
+                {"pagerduty_conn_id": "pagerduty_no_extra"},
+                "pagerduty_token_without_extra",
+                None,
+                id="without-routing-key-extra",
+            ),
+            pytest.param(
+                {"token": "pagerduty_param_token", "pagerduty_conn_id": DEFAULT_CONN_ID},
+                "pagerduty_param_token",
+                "integration_key",
+                id="token-parameter-override",
+            ),
+        ],
+    )
+    def test_token_and_routing_key(self, hook_kwargs, expected_token, expected_routing_key):
+        hook = PagerdutyHook(**hook_kwargs)
+        assert hook.token == expected_token
+        assert hook.routing_key == expected_routing_key
+
+    @mock.patch.object(pagerduty, "RestApiV2Client")
+    def test_client(self, mock_client_cls, default_hook):
+        client = default_hook.client()
+        mock_client_cls.assert_called_once_with("token")
+        assert client is mock_client_cls.return_value
@@ -33,15 +33,15 @@ def events_connections(create_connection_without_db):
 
 
 class TestPagerdutyEventsHook:
-    def test_get_integration_key_from_password(self, events_connections):
+    def test_get_integration_key_from_password(self):
         hook = PagerdutyEventsHook(pagerduty_events_conn_id=DEFAULT_CONN_ID)
-        assert hook.integration_key == "events_token", "token initialised."
+        assert hook.integration_key == "events_token"
 
-    def test_token_parameter_override(self, events_connections):
+    def test_token_parameter_override(self):
         hook = PagerdutyEventsHook(integration_key="override_key", pagerduty_events_conn_id=DEFAULT_CONN_ID)
-        assert hook.integration_key == "override_key", "token initialised."
+        assert hook.integration_key == "override_key"
 
-    def test_create_change_event(self, requests_mock, events_connections):
+    def test_create_change_event(self, requests_mock):
         hook = PagerdutyEventsHook(pagerduty_events_conn_id=DEFAULT_CONN_ID)
         mock_response_body = {
             "message": "Change event processed",
@@ -49,9 +49,9 @@ class TestPagerdutyEventsHook:
         }
         requests_mock.post("https://events.pagerduty.com/v2/change/enqueue", json=mock_response_body)
         resp = hook.create_change_event(summary="test", source="airflow")
-        assert resp is None, "No response expected for change event"
+        assert resp is None
 
-    def test_send_event(self, requests_mock, events_connections):
+    def test_send_event(self, requests_mock):
         hook = PagerdutyEventsHook(pagerduty_events_conn_id=DEFAULT_CONN_ID)
         dedup_key = "samplekeyhere"
         mock_response_body = {